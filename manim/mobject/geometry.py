@@ -5,6 +5,7 @@ geometry.py
 Classes implementing geometric objects, mostly derived from MObject.
 
 """
+import functools
 import warnings
 import numpy as np
 import math
@@ -14,15 +15,12 @@ from ..mobject.mobject import Mobject
 from ..mobject.types.vectorized_mobject import VGroup
 from ..mobject.types.vectorized_mobject import VMobject
 from ..mobject.types.vectorized_mobject import DashedVMobject
+from ..utils.bezier import interpolate
 from ..utils.config_ops import digest_config
-from ..utils.iterables import adjacent_n_tuples
-from ..utils.iterables import adjacent_pairs
 from ..utils.simple_functions import fdiv
 from ..utils.space_ops import angle_of_vector
-from ..utils.space_ops import angle_between_vectors
 from ..utils.space_ops import compass_directions
 from ..utils.space_ops import line_intersection
-from ..utils.space_ops import get_norm
 from ..utils.space_ops import normalize
 from ..utils.space_ops import rotate_vector
 
@@ -33,6 +31,138 @@ DEFAULT_DASH_LENGTH = 0.05
 DEFAULT_ARROW_TIP_LENGTH = 0.35
 
 
+def _norm3(vect):
+    """
+    Euclidean norm of a 3D vector, avoiding the overhead of
+    np.linalg.norm and get_norm for such small inputs.
+    """
+    return math.sqrt(vect[0] * vect[0] + vect[1] * vect[1] + vect[2] * vect[2])
+
+
+@functools.lru_cache(maxsize=256)
+def _arc_template(num_components, start_angle, angle):
+    """
+    Returns the anchors and (scaled) tangent vectors of a unit arc
+    centered at ORIGIN. The result is cached, so the returned arrays
+    are read-only; callers must copy before modifying them.
+    """
+    # Coordinates are computed as contiguous rows (x, y, z), and
+    # only transposed to the usual (N, 3) layout at the end
+    thetas = np.linspace(start_angle, start_angle + angle, num_components,)
+    anchors_xyz = np.zeros((3, num_components))
+    np.cos(thetas, out=anchors_xyz[0])
+    np.sin(thetas, out=anchors_xyz[1])
+    # Figure out which control points will give the
+    # Appropriate tangent lines to the circle
+    d_theta = angle / (num_components - 1.0)
+    # Rotating all 90 degrees, via (x, y) -> (-y, x), is just a
+    # swap of the x and y rows
+    tangents_xyz = np.zeros((3, num_components))
+    np.multiply(anchors_xyz[1], -d_theta / 3, out=tangents_xyz[0])
+    np.multiply(anchors_xyz[0], d_theta / 3, out=tangents_xyz[1])
+    anchors = np.ascontiguousarray(anchors_xyz.T)
+    tangent_vectors = np.ascontiguousarray(tangents_xyz.T)
+    anchors.flags.writeable = False
+    tangent_vectors.flags.writeable = False
+    return anchors, tangent_vectors
+
+
+def _arc_control_points(start_angle, angle, num_components, radius=1.0, center=ORIGIN):
+    """
+    Returns the bezier control points of an arc with the given
+    radius and center, laid out as VMobject points, without
+    having to instantiate an Arc.
+    """
+    # Plain Python scalars as cache keys, as e.g. 0-d arrays aren't hashable
+    anchors, tangent_vectors = _arc_template(
+        int(num_components), float(start_angle), float(angle)
+    )
+    points = np.empty((4 * (num_components - 1), 3))
+    points[0::4] = anchors[:-1]
+    # Use tangent vectors to deduce handles
+    np.add(anchors[:-1], tangent_vectors[:-1], out=points[1::4])
+    np.subtract(anchors[1:], tangent_vectors[1:], out=points[2::4])
+    points[3::4] = anchors[1:]
+    points *= radius
+    points += center
+    return points
+
+
+def _round_corners_geometry(vertices, radius):
+    """
+    For every corner of the polygon with the given vertices, computes
+    the start point, end point and angle of the arc replacing it when
+    rounded with the given radius. The corner at vertices[i + 1] comes
+    i-th, matching Polygon.round_corners.
+    """
+    # Work on every corner (v1, v2, v3) at once, with v2
+    # running over the vertices shifted by one
+    vects1 = np.roll(vertices, -1, axis=0) - vertices
+    vects2 = np.roll(vects1, -1, axis=0)
+    norms1 = np.linalg.norm(vects1, axis=1, keepdims=True)
+    norms2 = np.linalg.norm(vects2, axis=1, keepdims=True)
+    unit_vects1 = np.divide(vects1, norms1, out=np.zeros_like(vects1), where=norms1 > 0)
+    unit_vects2 = np.divide(vects2, norms2, out=np.zeros_like(vects2), where=norms2 > 0)
+    cos_angles = np.einsum("ij,ij->i", unit_vects1, unit_vects2)
+    angles = np.arccos(np.clip(cos_angles, -1, 1))
+    # Negative radius gives concave curves
+    angles *= np.sign(radius)
+    # Distance between vertex and start of the arc
+    cut_off_lengths = (radius * np.tan(angles / 2))[:, np.newaxis]
+    # Determines counterclockwise vs. clockwise, using
+    # the z-component of cross(vect1, vect2)
+    signs = np.sign(vects1[:, 0] * vects2[:, 1] - vects1[:, 1] * vects2[:, 0])
+    corners = np.roll(vertices, -1, axis=0)
+    arc_starts = corners - unit_vects1 * cut_off_lengths
+    arc_ends = corners + unit_vects2 * cut_off_lengths
+    return arc_starts, arc_ends, signs * angles
+
+
+def _overrides_any(mobject, base, *method_names):
+    """
+    Whether the class of mobject overrides any of the given methods
+    of base, in which case shortcuts bypassing them can't be taken.
+    """
+    cls = type(mobject)
+    return any(getattr(cls, name) is not getattr(base, name) for name in method_names)
+
+
+def _corner_points(corners):
+    """
+    Returns the VMobject points of the polygonal path through the
+    given corners, as VMobject.set_points_as_corners would set them.
+    """
+    points = np.empty((4 * (len(corners) - 1), 3))
+    for index, alpha in enumerate(np.linspace(0, 1, 4)):
+        points[index::4] = interpolate(corners[:-1], corners[1:], alpha)
+    return points
+
+
+@functools.lru_cache(maxsize=256)
+def _regular_polygon_vertices(n, start_angle):
+    """
+    Cached version of compass_directions for RegularPolygon,
+    keyed on the number of sides and the (rounded) start angle.
+    The returned array is read-only.
+    """
+    start_vect = rotate_vector(RIGHT, start_angle)
+    vertices = compass_directions(n, start_vect)
+    vertices.flags.writeable = False
+    return vertices
+
+
+@functools.lru_cache(maxsize=256)
+def _regular_polygon_points(n, start_angle):
+    """
+    Cached points of the closed path through the vertices given by
+    _regular_polygon_vertices. The returned array is read-only.
+    """
+    vertices = _regular_polygon_vertices(n, start_angle)
+    points = _corner_points(np.vstack([vertices, vertices[:1]]))
+    points.flags.writeable = False
+    return points
+
+
 class TipableVMobject(VMobject):
     """
     Meant for shared functionality between Arc and Line.
@@ -60,6 +190,14 @@ class TipableVMobject(VMobject):
         "tip_style": {"fill_opacity": 1, "stroke_width": 0,},
     }
 
+    # Whether self.tip and self.start_tip are currently submobjects,
+    # kept in sync whenever submobjects or the tip attributes change
+    _has_tip = False
+    _has_start_tip = False
+
+    # Angles of freshly created tips, see get_unpositioned_tip_angle
+    _unpositioned_tip_angles = {}
+
     # Adding, Creating, Modifying tips
 
     def add_tip(self, tip_length=None, at_start=False):
@@ -80,7 +218,12 @@ class TipableVMobject(VMobject):
         the newly instantiated tip to the caller.
         """
         tip = self.get_unpositioned_tip(tip_length)
-        self.position_tip(tip, at_start)
+        tip_angle = None
+        # An overridden get_unpositioned_tip may return a tip that
+        # isn't fresh, so its angle has to be measured
+        if not _overrides_any(self, TipableVMobject, "get_unpositioned_tip"):
+            tip_angle = self.get_unpositioned_tip_angle(tip)
+        self.position_tip(tip, at_start, tip_angle)
         return tip
 
     def get_unpositioned_tip(self, tip_length=None):
@@ -96,7 +239,21 @@ class TipableVMobject(VMobject):
         tip = ArrowTip(length=tip_length, **style)
         return tip
 
-    def position_tip(self, tip, at_start=False):
+    def get_unpositioned_tip_angle(self, tip):
+        """
+        Returns the angle of a tip freshly returned by get_unpositioned_tip.
+        It only depends on the tip's class and start_angle, so it is cached.
+        """
+        start_angle = getattr(tip, "start_angle", None)
+        if start_angle is None or getattr(tip, "length", 0) <= 0:
+            return tip.get_angle()
+        key = (type(tip), start_angle)
+        angles = TipableVMobject._unpositioned_tip_angles
+        if key not in angles:
+            angles[key] = tip.get_angle()
+        return angles[key]
+
+    def position_tip(self, tip, at_start=False, tip_angle=None):
         # Last two control points, defining both
         # the end, and the tangency direction
         if at_start:
@@ -105,7 +262,15 @@ class TipableVMobject(VMobject):
         else:
             handle = self.get_last_handle()
             anchor = self.get_end()
-        tip.rotate(angle_of_vector(handle - anchor) - PI - tip.get_angle())
+        if tip_angle is None:
+            tip_angle = tip.get_angle()
+        angle = angle_of_vector(handle - anchor) - PI - tip_angle
+        # Rotate about OUT with a single matrix product per family
+        # member, as the following shift makes the center irrelevant
+        c, s = math.cos(angle), math.sin(angle)
+        rotation = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+        for mob in tip.family_members_with_points():
+            mob.points = np.dot(mob.points, rotation.T)
         tip.shift(anchor - tip.get_tip_point())
         return tip
 
@@ -128,15 +293,39 @@ class TipableVMobject(VMobject):
             self.start_tip = tip
         else:
             self.tip = tip
+        self.update_tip_flags()
+        return self
+
+    @property
+    def submobjects(self):
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        # Assigning the list directly, as Mobject.add and various
+        # animations do, must keep the tip flags in sync
+        self._submobjects = submobjects
+        self.update_tip_flags()
+
+    def remove(self, *mobjects):
+        VMobject.remove(self, *mobjects)
+        self.update_tip_flags()
         return self
 
     # Checking for tips
 
+    def update_tip_flags(self):
+        self._has_tip = hasattr(self, "tip") and self.tip in self.submobjects
+        self._has_start_tip = (
+            hasattr(self, "start_tip") and self.start_tip in self.submobjects
+        )
+        return self
+
     def has_tip(self):
-        return hasattr(self, "tip") and self.tip in self
+        return self._has_tip
 
     def has_start_tip(self):
-        return hasattr(self, "start_tip") and self.start_tip in self
+        return self._has_start_tip
 
     # Getters
 
@@ -182,21 +371,24 @@ class TipableVMobject(VMobject):
     def get_last_handle(self):
         return self.points[-2]
 
+    # get_end and get_start read the tip flags directly, rather than
+    # going through has_tip and has_start_tip, as they are called a lot
+
     def get_end(self):
-        if self.has_tip():
+        if self._has_tip:
             return self.tip.get_start()
         else:
             return VMobject.get_end(self)
 
     def get_start(self):
-        if self.has_start_tip():
+        if self._has_start_tip:
             return self.start_tip.get_start()
         else:
             return VMobject.get_start(self)
 
     def get_length(self):
         start, end = self.get_start_and_end()
-        return get_norm(start - end)
+        return _norm3(start - end)
 
 
 class Arc(TipableVMobject):
@@ -215,32 +407,19 @@ class Arc(TipableVMobject):
 
     def generate_points(self):
         self.set_pre_positioned_points()
-        self.scale(self.radius, about_point=ORIGIN)
-        self.shift(self.arc_center)
+        if _overrides_any(
+            self, Arc, "scale", "shift", "apply_points_function_about_point"
+        ):
+            self.scale(self.radius, about_point=ORIGIN)
+            self.shift(self.arc_center)
+        else:
+            # Same as the scale and shift above, without the overhead
+            self.points *= self.radius
+            self.points += self.arc_center
 
     def set_pre_positioned_points(self):
-        anchors = np.array(
-            [
-                np.cos(a) * RIGHT + np.sin(a) * UP
-                for a in np.linspace(
-                    self.start_angle,
-                    self.start_angle + self.angle,
-                    self.num_components,
-                )
-            ]
-        )
-        # Figure out which control points will give the
-        # Appropriate tangent lines to the circle
-        d_theta = self.angle / (self.num_components - 1.0)
-        tangent_vectors = np.zeros(anchors.shape)
-        # Rotate all 90 degress, via (x, y) -> (-y, x)
-        tangent_vectors[:, 1] = anchors[:, 0]
-        tangent_vectors[:, 0] = -anchors[:, 1]
-        # Use tangent vectors to deduce anchors
-        handles1 = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
-        handles2 = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
-        self.set_anchors_and_handles(
-            anchors[:-1], handles1, handles2, anchors[1:],
+        self.points = _arc_control_points(
+            self.start_angle, self.angle, self.num_components,
         )
 
     def get_arc_center(self, warning=True):
@@ -253,9 +432,9 @@ class Arc(TipableVMobject):
         # Tangent vectors
         t1 = h1 - a1
         t2 = h2 - a2
-        # Normals
-        n1 = rotate_vector(t1, TAU / 4)
-        n2 = rotate_vector(t2, TAU / 4)
+        # Normals, rotating 90 degrees via (x, y) -> (-y, x)
+        n1 = np.array([-t1[1], t1[0], t1[2]])
+        n2 = np.array([-t2[1], t2[0], t2[2]])
         try:
             return line_intersection(line1=(a1, a1 + n1), line2=(a2, a2 + n2),)
         except Exception:
@@ -285,7 +464,7 @@ class ArcBetweenPoints(Arc):
                 radius *= -1
             else:
                 sign = 2
-            halfdist = np.linalg.norm(np.array(start) - np.array(end)) / 2
+            halfdist = _norm3(np.subtract(start, end)) / 2
             if radius < halfdist:
                 raise ValueError(
                     """ArcBetweenPoints called with a radius that is
@@ -304,7 +483,7 @@ class ArcBetweenPoints(Arc):
         if radius is None:
             center = self.get_arc_center(warning=False)
             if not self._failed_to_get_center:
-                self.radius = np.linalg.norm(np.array(start) - np.array(center))
+                self.radius = _norm3(np.subtract(start, center))
             else:
                 self.radius = math.inf
 
@@ -382,20 +561,21 @@ class AnnularSector(Arc):
     }
 
     def generate_points(self):
-        inner_arc, outer_arc = [
-            Arc(
-                start_angle=self.start_angle,
-                angle=self.angle,
+        inner_points, outer_points = [
+            _arc_control_points(
+                self.start_angle,
+                self.angle,
+                self.num_components,
                 radius=radius,
-                arc_center=self.arc_center,
+                center=self.arc_center,
             )
             for radius in (self.inner_radius, self.outer_radius)
         ]
-        outer_arc.reverse_points()
-        self.append_points(inner_arc.points)
-        self.add_line_to(outer_arc.points[0])
-        self.append_points(outer_arc.points)
-        self.add_line_to(inner_arc.points[0])
+        outer_points = outer_points[::-1]
+        self.append_points(inner_points)
+        self.add_line_to(outer_points[0])
+        self.append_points(outer_points)
+        self.add_line_to(inner_points[0])
 
 
 class Sector(AnnularSector):
@@ -414,12 +594,18 @@ class Annulus(Circle):
 
     def generate_points(self):
         self.radius = self.outer_radius
-        outer_circle = Circle(radius=self.outer_radius)
-        inner_circle = Circle(radius=self.inner_radius)
-        inner_circle.reverse_points()
-        self.append_points(outer_circle.points)
-        self.append_points(inner_circle.points)
-        self.shift(self.arc_center)
+        outer_points, inner_points = [
+            _arc_control_points(
+                self.start_angle,
+                self.angle,
+                self.num_components,
+                radius=radius,
+                center=self.arc_center,
+            )
+            for radius in (self.outer_radius, self.inner_radius)
+        ]
+        self.append_points(outer_points)
+        self.append_points(inner_points[::-1])
 
 
 class Line(TipableVMobject):
@@ -439,7 +625,8 @@ class Line(TipableVMobject):
             self.set_points(arc.points)
         else:
             self.set_points_as_corners([self.start, self.end])
-        self.account_for_buff()
+        if self.buff != 0:
+            self.account_for_buff()
 
     def set_path_arc(self, new_value):
         self.path_arc = new_value
@@ -461,6 +648,12 @@ class Line(TipableVMobject):
         return self
 
     def set_start_and_end_attrs(self, start, end):
+        if not isinstance(start, Mobject) and not isinstance(end, Mobject):
+            # Plain points, so there are no boundary
+            # points to look up
+            self.start = np.array(start, dtype=float)
+            self.end = np.array(end, dtype=float)
+            return
         # If either start or end are Mobjects, this
         # gives their centers
         rough_start = self.pointify(start)
@@ -469,8 +662,8 @@ class Line(TipableVMobject):
         # Now that we know the direction between them,
         # we can the appropriate boundary point from
         # start and end, if they're mobjects
-        self.start = self.pointify(start, vect)
-        self.end = self.pointify(end, -vect)
+        self.start = np.array(self.pointify(start, vect))
+        self.end = np.array(self.pointify(end, -vect))
 
     def pointify(self, mob_or_point, direction=None):
         if isinstance(mob_or_point, Mobject):
@@ -479,7 +672,9 @@ class Line(TipableVMobject):
                 return mob.get_center()
             else:
                 return mob.get_boundary_point(direction)
-        return np.array(mob_or_point)
+        # This may alias the given point, so callers storing
+        # the result copy it
+        return np.asarray(mob_or_point, dtype=float)
 
     def put_start_and_end_on(self, start, end):
         curr_start, curr_end = self.get_start_and_end()
@@ -528,15 +723,23 @@ class DashedLine(Line):
         "positive_space_ratio": 0.5,
     }
 
+    # Whether the line was split into dash submobjects, as opposed
+    # to staying a plain line (possibly with tips as submobjects)
+    _dashed = False
+
     def __init__(self, *args, **kwargs):
         Line.__init__(self, *args, **kwargs)
         ps_ratio = self.positive_space_ratio
         num_dashes = self.calculate_num_dashes(ps_ratio)
+        if num_dashes <= 1:
+            # Too short to be dashed, so it stays a plain line
+            return
         dashes = DashedVMobject(
             self, num_dashes=num_dashes, positive_space_ratio=ps_ratio
         )
         self.clear_points()
         self.add(*dashes)
+        self._dashed = True
 
     def calculate_num_dashes(self, positive_space_ratio):
         try:
@@ -549,22 +752,28 @@ class DashedLine(Line):
         return fdiv(self.dash_length, self.dash_length + self.dash_spacing,)
 
     def get_start(self):
-        if len(self.submobjects) > 0:
+        if self._dashed:
             return self.submobjects[0].get_start()
         else:
             return Line.get_start(self)
 
     def get_end(self):
-        if len(self.submobjects) > 0:
+        if self._dashed:
             return self.submobjects[-1].get_end()
         else:
             return Line.get_end(self)
 
     def get_first_handle(self):
-        return self.submobjects[0].points[1]
+        if self._dashed:
+            return self.submobjects[0].points[1]
+        else:
+            return Line.get_first_handle(self)
 
     def get_last_handle(self):
-        return self.submobjects[-1].points[-2]
+        if self._dashed:
+            return self.submobjects[-1].points[-2]
+        else:
+            return Line.get_last_handle(self)
 
 
 class TangentLine(Line):
@@ -608,34 +817,43 @@ class Arrow(Line):
         # TODO, should this be affected when
         # Arrow.set_stroke is called?
         self.initial_stroke_width = self.stroke_width
-        self.add_tip()
-        self.set_stroke_width_from_length()
+        length = self.get_length()
+        self.add_tip(tip_length=self.get_default_tip_length(length))
+        self.set_stroke_width_from_length(length)
 
     def scale(self, factor, **kwargs):
         if self.get_length() == 0:
             return self
 
-        has_tip = self.has_tip()
-        has_start_tip = self.has_start_tip()
-        if has_tip or has_start_tip:
-            old_tips = self.pop_tips()
+        old_tips = []
+        if self.has_tip():
+            old_tips.append((self.tip, False))
+        if self.has_start_tip():
+            old_tips.append((self.start_tip, True))
+        if old_tips:
+            self.pop_tips()
 
         VMobject.scale(self, factor, **kwargs)
-        self.set_stroke_width_from_length()
-
-        # So horribly confusing, must redo
-        if has_tip:
-            self.add_tip()
-            old_tips[0].points[:, :] = self.tip.points
-            self.remove(self.tip)
-            self.tip = old_tips[0]
-            self.add(self.tip)
-        if has_start_tip:
-            self.add_tip(at_start=True)
-            old_tips[1].points[:, :] = self.start_tip.points
-            self.remove(self.start_tip)
-            self.start_tip = old_tips[1]
-            self.add(self.start_tip)
+        length = self.get_length()
+        self.set_stroke_width_from_length(length)
+
+        # Rather than creating new tips, resize the old ones about
+        # their tip points and move them onto the new endpoints
+        for tip, at_start in old_tips:
+            tip_length = self.get_default_tip_length(length)
+            old_length = tip.get_length()
+            if old_length > 0:
+                ratio = np.sign(factor) * tip_length / old_length
+                anchor = self.get_start() if at_start else self.get_end()
+                tip.points = anchor + ratio * (tip.points - tip.get_tip_point())
+            else:
+                # A degenerate tip can't be resized, so take the
+                # points of a freshly created one instead
+                new_tip = self.create_tip(tip_length, at_start)
+                tip.points = np.array(new_tip.points)
+            self.reset_endpoints_based_on_tip(tip, at_start)
+            self.asign_tip_attr(tip, at_start)
+            self.add(tip)
         return self
 
     def get_normal_vector(self):
@@ -646,15 +864,18 @@ class Arrow(Line):
         self.normal_vector = self.get_normal_vector()
         return self
 
-    def get_default_tip_length(self):
+    def get_default_tip_length(self, length=None):
+        if length is None:
+            length = self.get_length()
         max_ratio = self.max_tip_length_to_length_ratio
-        return min(self.tip_length, max_ratio * self.get_length(),)
+        return min(self.tip_length, max_ratio * length,)
 
-    def set_stroke_width_from_length(self):
+    def set_stroke_width_from_length(self, length=None):
+        if length is None:
+            length = self.get_length()
         max_ratio = self.max_stroke_width_to_length_ratio
         self.set_stroke(
-            width=min(self.initial_stroke_width, max_ratio * self.get_length(),),
-            family=False,
+            width=min(self.initial_stroke_width, max_ratio * length,), family=False,
         )
         return self
 
@@ -693,37 +914,28 @@ class Polygon(VMobject):
 
     def __init__(self, *vertices, **kwargs):
         VMobject.__init__(self, **kwargs)
-        self.set_points_as_corners([*vertices, vertices[0]])
+        vertices = np.asarray(vertices, dtype=float)
+        # Close the path by repeating the first vertex
+        corners = np.empty((len(vertices) + 1, vertices.shape[1]))
+        corners[:-1] = vertices
+        corners[-1] = vertices[0]
+        self.set_points_as_corners(corners)
 
     def get_vertices(self):
         return self.get_start_anchors()
 
     def round_corners(self, radius=0.5):
-        vertices = self.get_vertices()
-        arcs = []
-        for v1, v2, v3 in adjacent_n_tuples(vertices, 3):
-            vect1 = v2 - v1
-            vect2 = v3 - v2
-            unit_vect1 = normalize(vect1)
-            unit_vect2 = normalize(vect2)
-            angle = angle_between_vectors(vect1, vect2)
-            # Negative radius gives concave curves
-            angle *= np.sign(radius)
-            # Distance between vertex and start of the arc
-            cut_off_length = radius * np.tan(angle / 2)
-            # Determines counterclockwise vs. clockwise
-            sign = np.sign(np.cross(vect1, vect2)[2])
-            arc = ArcBetweenPoints(
-                v2 - unit_vect1 * cut_off_length,
-                v2 + unit_vect2 * cut_off_length,
-                angle=sign * angle,
-            )
-            arcs.append(arc)
+        arc_starts, arc_ends, arc_angles = _round_corners_geometry(
+            self.get_vertices(), radius
+        )
+        arcs = [
+            ArcBetweenPoints(start, end, angle=angle)
+            for start, end, angle in zip(arc_starts, arc_ends, arc_angles)
+        ]
 
         self.clear_points()
         # To ensure that we loop through starting with last
-        arcs = [arcs[-1], *arcs[:-1]]
-        for arc1, arc2 in adjacent_pairs(arcs):
+        for arc1, arc2 in zip([arcs[-1], *arcs[:-1]], arcs):
             self.append_points(arc1.points)
             line = Line(arc1.get_end(), arc2.get_start())
             # Make sure anchors are evenly distributed
@@ -745,9 +957,16 @@ class RegularPolygon(Polygon):
                 self.start_angle = 0
             else:
                 self.start_angle = 90 * DEGREES
-        start_vect = rotate_vector(RIGHT, self.start_angle)
-        vertices = compass_directions(n, start_vect)
-        Polygon.__init__(self, *vertices, **kwargs)
+        # Plain Python scalars as cache keys, as e.g. 0-d arrays aren't hashable
+        n = int(n)
+        start_angle = round(float(self.start_angle), 12)
+        if not _overrides_any(self, RegularPolygon, "set_points_as_corners"):
+            # Copy cached points instead of going through Polygon.__init__
+            VMobject.__init__(self, **kwargs)
+            self.points = np.array(_regular_polygon_points(n, start_angle))
+        else:
+            vertices = _regular_polygon_vertices(n, start_angle)
+            Polygon.__init__(self, *vertices, **kwargs)
 
 
 class Triangle(RegularPolygon):
@@ -781,7 +1000,7 @@ class ArrowTip(Triangle):
         return angle_of_vector(self.get_vector())
 
     def get_length(self):
-        return get_norm(self.get_vector())
+        return _norm3(self.get_vector())
 
 
 class Rectangle(Polygon):
@@ -793,7 +1012,27 @@ class Rectangle(Polygon):
         "close_new_points": True,
     }
 
+    # Points of the 2x2 square through UL, UR, DR and DL, which is
+    # stretched to the right width and height directly instead of
+    # going through Polygon.__init__, set_width and set_height,
+    # unless a subclass overrides any of the methods involved
+    _BASE_POINTS = _corner_points(np.array([UL, UR, DR, DL, UL]))
+    _BASE_POINTS.flags.writeable = False
+
     def __init__(self, **kwargs):
+        if not _overrides_any(
+            self,
+            Rectangle,
+            "set_points_as_corners",
+            "set_width",
+            "set_height",
+            "rescale_to_fit",
+            "stretch",
+            "apply_points_function_about_point",
+        ):
+            VMobject.__init__(self, **kwargs)
+            self.points = self._BASE_POINTS * [self.width / 2, self.height / 2, 1]
+            return
         Polygon.__init__(self, UL, UR, DR, DL, **kwargs)
         self.set_width(self.width, stretch=True)
         self.set_height(self.height, stretch=True)
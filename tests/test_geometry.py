@@ -107,3 +107,126 @@ class RoundedRectangleTest(Scene):
 
 def test_scenes():
     utils_test_scenes(get_scenes_to_test(__name__), "geometry")
+
+
+def test_tip_flags_follow_submobjects():
+    arrow = Arrow(LEFT, RIGHT)
+    assert arrow.has_tip()
+    end_without_tip = arrow.points[-1]
+    arrow.submobjects = []
+    assert not arrow.has_tip()
+    np.testing.assert_allclose(arrow.get_end(), end_without_tip)
+
+
+def test_copy_of_tipped_line_measures_to_tip_base():
+    line = Line(LEFT, RIGHT).add_tip()
+    copy = line.copy()
+    assert not copy.has_tip()
+    np.testing.assert_allclose(copy.get_end(), [0.65, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(copy.get_length(), 1.65)
+
+
+def test_arrow_scale_with_only_start_tip():
+    arrow = Arrow(LEFT, RIGHT)
+    arrow.pop_tips()
+    arrow.add_tip(at_start=True)
+    start_tip = arrow.start_tip
+    arrow.scale(0.5)
+    assert arrow.has_start_tip() and not arrow.has_tip()
+    assert arrow.start_tip is start_tip and start_tip in arrow.submobjects
+    np.testing.assert_allclose(arrow.get_start(), [-0.375, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(arrow.get_end(), [0.375, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(normalize(start_tip.get_vector()), LEFT, atol=1e-8)
+
+
+def test_arrow_scale_negative_factor():
+    arrow = Arrow(LEFT, RIGHT).scale(-1)
+    np.testing.assert_allclose(arrow.get_start(), [0.75, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(arrow.get_end(), [-0.75, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(normalize(arrow.tip.get_vector()), LEFT, atol=1e-8)
+    np.testing.assert_allclose(arrow.tip.get_length(), 0.35)
+
+
+def test_arrow_scale_about_point():
+    arrow = Arrow(LEFT, RIGHT).scale(2, about_point=0.75 * LEFT)
+    np.testing.assert_allclose(arrow.get_start(), [-0.75, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(arrow.get_end(), [2.25, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(normalize(arrow.tip.get_vector()), RIGHT, atol=1e-8)
+    np.testing.assert_allclose(arrow.tip.get_length(), 0.35)
+
+
+def test_short_dashed_line_stays_solid():
+    line = DashedLine(ORIGIN, 0.08 * RIGHT)
+    assert len(line.submobjects) == 0
+    np.testing.assert_allclose(line.get_start(), ORIGIN)
+    np.testing.assert_allclose(line.get_end(), [0.08, 0, 0])
+    np.testing.assert_allclose(line.get_length(), 0.08)
+
+
+def test_short_dashed_line_with_tip():
+    line = DashedLine(ORIGIN, 0.08 * RIGHT).add_tip(tip_length=0.02)
+    assert line.has_tip()
+    np.testing.assert_allclose(line.get_start(), ORIGIN, atol=1e-8)
+    np.testing.assert_allclose(line.get_end(), [0.08, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(line.get_length(), 0.08)
+
+
+def test_line_does_not_alias_its_endpoints():
+    assert Line(LEFT, RIGHT).start is not LEFT
+    point = np.zeros(3)
+    line = Line(point, RIGHT)
+    point[0] = 5
+    line.set_path_arc(0.5)
+    np.testing.assert_allclose(line.get_start(), ORIGIN, atol=1e-8)
+
+
+def test_arrow_tip_angle_after_stretch():
+    tip = ArrowTip()
+    tip.get_angle()
+    tip.stretch(-1, 0)
+    np.testing.assert_allclose(tip.get_angle(), 0, atol=1e-8)
+
+
+def test_construction_shortcuts_respect_overrides():
+    class ShiftedArc(Arc):
+        def set_pre_positioned_points(self):
+            Arc.set_pre_positioned_points(self)
+            self.points += UP
+
+    class ShiftedRectangle(Rectangle):
+        def set_points_as_corners(self, points):
+            return Rectangle.set_points_as_corners(self, np.array(points) + UP)
+
+    arc = Arc(radius=2, arc_center=RIGHT)
+    shifted_arc = ShiftedArc(radius=2, arc_center=RIGHT)
+    np.testing.assert_allclose(shifted_arc.points, arc.points + 2 * UP)
+    rect = Rectangle()
+    shifted_rect = ShiftedRectangle()
+    np.testing.assert_allclose(shifted_rect.get_center(), rect.get_center() + UP)
+
+
+def test_array_scalar_parameters():
+    np.testing.assert_allclose(Arc(angle=np.array(1.0)).points, Arc(angle=1.0).points)
+    np.testing.assert_allclose(
+        RegularPolygon(start_angle=np.array(0.5)).points,
+        RegularPolygon(start_angle=0.5).points,
+    )
+
+
+def test_arrow_scale_from_zero_length():
+    arrow = Arrow(ORIGIN, ORIGIN, buff=0)
+    arrow.put_start_and_end_on(LEFT, RIGHT)
+    arrow.scale(2)
+    np.testing.assert_allclose(arrow.tip.get_length(), 0.35)
+    np.testing.assert_allclose(arrow.get_end(), [2, 0, 0], atol=1e-8)
+
+
+def test_create_tip_respects_overridden_unpositioned_tip():
+    class RotatedTipLine(Line):
+        def get_unpositioned_tip(self, tip_length=None):
+            return Line.get_unpositioned_tip(self, tip_length).rotate(PI / 2)
+
+    line = RotatedTipLine(LEFT, RIGHT)
+    line.add_tip()
+    tip_vector = line.tip.get_tip_point() - line.tip.get_base()
+    np.testing.assert_allclose(tip_vector, [0.35, 0, 0], atol=1e-8)